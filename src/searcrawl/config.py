@@ -7,7 +7,9 @@ default values when environment variables are not set.
 """
 
 import os
-from typing import Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
 from dotenv import load_dotenv
 from loguru import logger
 
@@ -19,7 +21,10 @@ logger.info("Loading environment variable configuration")
 SEARXNG_HOST = os.getenv("SEARXNG_HOST", "localhost")
 SEARXNG_PORT = int(os.getenv("SEARXNG_PORT", "8080"))
 SEARXNG_BASE_PATH = os.getenv("SEARXNG_BASE_PATH", "/search")
-SEARXNG_API_BASE = f"http://{SEARXNG_HOST}:{SEARXNG_PORT}{SEARXNG_BASE_PATH}"
+SEARXNG_BASE_URL = f"http://{SEARXNG_HOST}:{SEARXNG_PORT}"
+SEARXNG_API_BASE = f"{SEARXNG_BASE_URL}{SEARXNG_BASE_PATH}"
+SEARXNG_HOST_HEADER = f"{SEARXNG_HOST}:{SEARXNG_PORT}"
+SEARXNG_TIMEOUT = float(os.getenv("SEARXNG_TIMEOUT", "30"))
 
 # API Service Configuration
 API_HOST = os.getenv("API_HOST", "0.0.0.0")
@@ -29,6 +34,14 @@ API_PORT = int(os.getenv("API_PORT", "3000"))
 DEFAULT_SEARCH_LIMIT = int(os.getenv("DEFAULT_SEARCH_LIMIT", "10"))
 CONTENT_FILTER_THRESHOLD = float(os.getenv("CONTENT_FILTER_THRESHOLD", "0.6"))
 WORD_COUNT_THRESHOLD = int(os.getenv("WORD_COUNT_THRESHOLD", "10"))
+MAX_RETRY_URLS = int(os.getenv("MAX_RETRY_URLS", "10"))
+# At least one page, otherwise every crawl would wait forever
+CRAWL_CONCURRENCY = max(1, int(os.getenv("CRAWL_CONCURRENCY", "5")))
+MAX_DOC_SIZE = int(os.getenv("MAX_DOC_SIZE", "500000"))
+MAX_LINE_LENGTH = int(os.getenv("MAX_LINE_LENGTH", "10000"))
+PLAYWRIGHT_INSTALL_ON_STARTUP = os.getenv(
+    "PLAYWRIGHT_INSTALL_ON_STARTUP", "false"
+).lower() in ("1", "true", "yes")
 
 # Search Engine Configuration
 DISABLED_ENGINES = os.getenv(
@@ -41,30 +54,40 @@ ENABLED_ENGINES = os.getenv("ENABLED_ENGINES", "baidu__general")
 SEARCH_LANGUAGE = os.getenv("SEARCH_LANGUAGE", "auto")
 
 
-def get_config_info() -> Dict[str, Any]:
-    """Returns a dictionary of current configuration information
+@lru_cache(maxsize=1)
+def get_config_info() -> Mapping[str, Any]:
+    """Returns a read-only mapping of current configuration information
+
+    The mapping is built once and cached, since configuration is only read
+    from the environment at import time.
 
     Returns:
-        dict: Dictionary containing all configuration parameters
+        Mapping: Read-only mapping containing all configuration parameters
     """
-    return {
-        "searxng": {
+    return MappingProxyType({
+        "searxng": MappingProxyType({
             "host": SEARXNG_HOST,
             "port": SEARXNG_PORT,
             "base_path": SEARXNG_BASE_PATH,
-            "api_base": SEARXNG_API_BASE
-        },
-        "api": {
+            "api_base": SEARXNG_API_BASE,
+            "timeout": SEARXNG_TIMEOUT
+        }),
+        "api": MappingProxyType({
             "host": API_HOST,
             "port": API_PORT
-        },
-        "crawler": {
+        }),
+        "crawler": MappingProxyType({
             "default_search_limit": DEFAULT_SEARCH_LIMIT,
             "content_filter_threshold": CONTENT_FILTER_THRESHOLD,
-            "word_count_threshold": WORD_COUNT_THRESHOLD
-        },
-        "search_engines": {
+            "word_count_threshold": WORD_COUNT_THRESHOLD,
+            "max_retry_urls": MAX_RETRY_URLS,
+            "crawl_concurrency": CRAWL_CONCURRENCY,
+            "max_doc_size": MAX_DOC_SIZE,
+            "max_line_length": MAX_LINE_LENGTH,
+            "playwright_install_on_startup": PLAYWRIGHT_INSTALL_ON_STARTUP
+        }),
+        "search_engines": MappingProxyType({
             "disabled": DISABLED_ENGINES,
             "enabled": ENABLED_ENGINES
-        }
-    }
\ No newline at end of file
+        })
+    })
@@ -7,43 +7,215 @@ It encapsulates the AsyncWebCrawler from crawl4ai library and provides
 high-level methods for crawling web pages and processing their content.
 """
 
-from typing import List, Dict, Any
+import asyncio
+from typing import List, Dict, Any, Callable, Iterable, Optional, cast
 from crawl4ai import (
     AsyncWebCrawler,
     BrowserConfig,
     CrawlerRunConfig,
     CacheMode,
+    RateLimiter,
+    SemaphoreDispatcher,
 )
 from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
 from crawl4ai.content_filter_strategy import PruningContentFilter
-import markdown
-from bs4 import BeautifulSoup
 import re
-import http.client
-from codecs import encode
-import json
+import httpx
+import orjson
+from urllib.parse import urlencode, urlsplit, urlunsplit
 from fastapi import HTTPException
 from loguru import logger
 
 # Import configuration
 from searcrawl.config import (
-    SEARXNG_HOST,
-    SEARXNG_PORT,
     SEARXNG_BASE_PATH,
+    SEARXNG_BASE_URL,
+    SEARXNG_HOST_HEADER,
+    SEARXNG_TIMEOUT,
     DISABLED_ENGINES,
     ENABLED_ENGINES,
     SEARCH_LANGUAGE,
     CONTENT_FILTER_THRESHOLD,
-    WORD_COUNT_THRESHOLD
+    WORD_COUNT_THRESHOLD,
+    MAX_RETRY_URLS,
+    CRAWL_CONCURRENCY,
+    MAX_DOC_SIZE,
+    MAX_LINE_LENGTH
 )
 
+# WebCrawler.markdown_to_text needs the optional "html" extra (pip install "searcrawl[html]")
+_MD: Optional[Callable[[str], Any]]
+try:
+    import mistune
+except ImportError:  # pragma: no cover
+    _MD = None
+else:
+    # HTML renderer configured like mistune.html
+    _MD = mistune.create_markdown(escape=False, plugins=["strikethrough", "footnotes", "table"])
+
+try:
+    # C-based parser, much faster than html.parser on large crawl output
+    from lxml import etree
+except ImportError:  # pragma: no cover
+    etree = None
+
+# Precompiled patterns used by WebCrawler.markdown_to_text_regex and markdown_to_text_fast
+_RE_HEADER = re.compile(r'#+\s*')
+# Link text and target are bounded and stay on one line, so an unclosed '['
+# cannot trigger a scan over the rest of the document
+_RE_LINK = re.compile(r'!?\[([^\]\n]{0,500})\]\([^)\n]{0,2000}\)')
+_RE_LIST = re.compile(r'^[\*\-\+]\s*', re.MULTILINE)
+_RE_QUOTE = re.compile(r'^>\s*', re.MULTILINE)
+# Bold, italic, inline code and backslash escapes combined into a single
+# alternation so the text is scanned once. Inner spans are bounded in length
+# and never cross a line break, so an unmatched marker costs at most a short
+# lookahead instead of a scan over the rest of the document. Emphasis must
+# hug its content ('2 * 4' is not italic), and '_' emphasis must not sit
+# inside a word ('snake_case_names' is left alone).
+_RE_INLINE = re.compile(
+    r'\*\*(\S(?:.{0,500}?\S)?)\*\*'
+    r'|(?<!\w)__(\S(?:.{0,500}?\S)?)__(?!\w)'
+    r'|\*([^\s*](?:[^*\n]{0,500}?[^\s*])?)\*'
+    r'|(?<!\w)_([^\s_](?:[^_\n]{0,500}?[^\s_])?)_(?!\w)'
+    r'|`([^`\n]{0,500})`'
+    r'|\\([\\`*_{}\[\]()#+\-.!])'
+)
+# Leading heading, quote and list markers of a single line
+_RE_LINE_PREFIX = re.compile(r'(?:#{1,6}(?:\s+|$)|>\s?|[*+-]\s+|\d+[.)]\s+)*')
+# Horizontal rules and '---' setext heading underlines; '===' lines are kept
+# so the separator between crawled pages survives
+_RE_RULE = re.compile(r'(?:[-*_]\s*){3,}')
+# Anchored to line starts so a miss costs a single pass over the text
+_RE_LONG_LINE = re.compile(r'^[^\n]{%d}' % (MAX_LINE_LENGTH + 1), re.MULTILINE)
+
+# Delay in seconds before retrying failed URLs
+_RETRY_DELAY = 0.5
+# HTTP status codes that are worth retrying despite being client errors
+_RETRYABLE_STATUS_CODES = {408, 425, 429}
+# Crawl errors that will not go away on retry
+_PERMANENT_ERROR_MARKERS = (
+    "ERR_NAME_NOT_RESOLVED",
+    "ERR_CERT_",
+    "ERR_SSL_",
+    "ERR_INVALID_URL",
+    "ERR_UNKNOWN_URL_SCHEME",
+)
+
+
+def _is_transient_failure(result: Any) -> bool:
+    """Decide whether a failed crawl result is worth retrying
+
+    Timeouts, server errors and empty content are treated as transient,
+    while client errors such as 404 and DNS or certificate failures are not.
+    """
+    status_code = getattr(result, 'status_code', None)
+    if status_code is not None and 400 <= status_code < 500:
+        return status_code in _RETRYABLE_STATUS_CODES
+    error_message = getattr(result, 'error_message', None) or ''
+    return not any(marker in error_message for marker in _PERMANENT_ERROR_MARKERS)
+
+
+def _truncate_markdown(markdown_str: str) -> str:
+    """Cap document and line length so text conversion has bounded cost
+
+    Crawled pages occasionally contain huge single lines such as minified
+    JSON, which are cut to MAX_LINE_LENGTH along with the whole document
+    being cut to MAX_DOC_SIZE. This only bounds the cost because the inline
+    patterns above never look further than a fixed distance or past a line
+    break; keep it that way when changing them.
+    """
+    if len(markdown_str) > MAX_DOC_SIZE:
+        logger.warning(
+            "Markdown content truncated from {} to {} characters", len(markdown_str), MAX_DOC_SIZE
+        )
+        markdown_str = markdown_str[:MAX_DOC_SIZE]
+    if _RE_LONG_LINE.search(markdown_str):
+        markdown_str = '\n'.join(line[:MAX_LINE_LENGTH] for line in markdown_str.split('\n'))
+    return markdown_str
+
+
+def _replace_inline(match: "re.Match[str]") -> str:
+    """Return the inner text of an emphasis or inline code match, or an escaped character"""
+    bold = match.group(1) or match.group(2)
+    if bold:
+        # Bold content may still contain italic, code or escapes
+        return _RE_INLINE.sub(_replace_inline, bold)
+    return next(group for group in match.groups()[2:] if group is not None)
+
+
+def _drop_fenced_lines(lines: Iterable[str]) -> List[str]:
+    """Return the lines that lie outside fenced code blocks
+
+    The content of an unterminated fence is kept, without its opening line.
+    """
+    kept: List[str] = []
+    fenced: List[str] = []
+    in_fence = False
+    for line in lines:
+        if line.lstrip().startswith('```'):
+            if in_fence:
+                fenced = []
+                in_fence = False
+            elif line.count('```') < 2:
+                # Opening fence; a line with two fences is a one-line block
+                in_fence = True
+            continue
+        if in_fence:
+            fenced.append(line)
+        else:
+            kept.append(line)
+    if in_fence:
+        kept.extend(fenced)
+    return kept
+
+
+class _SharedSemaphoreDispatcher(SemaphoreDispatcher):
+    """SemaphoreDispatcher that waits on a semaphore shared between runs
+
+    SemaphoreDispatcher creates a new semaphore for each run_urls call, which
+    only bounds the pages of a single request.
+    """
+
+    def __init__(self, semaphore: asyncio.Semaphore, rate_limiter: Optional[RateLimiter] = None):
+        super().__init__(semaphore_count=CRAWL_CONCURRENCY, rate_limiter=rate_limiter)
+        self._shared_semaphore = semaphore
+
+    async def crawl_url(
+        self,
+        url: str,
+        config: CrawlerRunConfig,
+        task_id: str,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> Any:
+        return await super().crawl_url(url, config, task_id, self._shared_semaphore)
+
 
 class WebCrawler:
     """Web crawler class that encapsulates web crawling and content processing functionality"""
 
-    def __init__(self):
-        """Initialize crawler instance"""
-        self.crawler = None
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        """Initialize crawler instance
+
+        Args:
+            http_client: HTTP client used for SearXNG requests; a client for the
+                configured SearXNG instance is created if None. The crawler
+                closes the client in close().
+        """
+        self.crawler: Optional[AsyncWebCrawler] = None
+        # Shared by every crawl, so concurrent requests crawl side by side
+        # while at most CRAWL_CONCURRENCY pages are open in total
+        self._crawl_semaphore = asyncio.Semaphore(CRAWL_CONCURRENCY)
+        # Async HTTP client so SearXNG requests reuse keep-alive connections
+        # without blocking the event loop
+        self._http = http_client or httpx.AsyncClient(
+            base_url=SEARXNG_BASE_URL,
+            headers={
+                'User-Agent': 'Sear-Crawl4AI/1.0.0',
+                'Accept': '*/*',
+                'Host': SEARXNG_HOST_HEADER,
+            },
+            timeout=SEARXNG_TIMEOUT
+        )
         logger.info("Initializing WebCrawler instance")
 
     async def initialize(self) -> None:
@@ -54,7 +226,17 @@ class WebCrawler:
         # Configure browser
         browser_config = BrowserConfig(headless=True, verbose=True)
         # Initialize crawler
-        self.crawler = await AsyncWebCrawler(config=browser_config).__aenter__()
+        async_crawler = AsyncWebCrawler(config=browser_config)
+        try:
+            self.crawler = await async_crawler.__aenter__()
+        except Exception:
+            # Playwright is started before the browser is launched, so a failed
+            # launch leaves its driver running; stop it before re-raising
+            try:
+                await async_crawler.close()
+            except Exception as close_error:
+                logger.warning("Cleanup after failed crawler initialization failed: {}", close_error)
+            raise
         logger.info("AsyncWebCrawler initialization completed")
 
     async def close(self) -> None:
@@ -62,6 +244,39 @@ class WebCrawler:
         if self.crawler:
             await self.crawler.__aexit__(None, None, None)
             logger.info("AsyncWebCrawler closed")
+        await self._http.aclose()
+
+    @staticmethod
+    def dedupe_urls(urls: List[str]) -> List[str]:
+        """Remove duplicate URLs while preserving order
+
+        URLs are compared after lowercasing the scheme and host, stripping a
+        trailing slash from the path and dropping the fragment. The first
+        occurrence of each URL is kept unchanged.
+
+        Args:
+            urls: List of URLs, possibly containing duplicates
+
+        Returns:
+            List[str]: URLs with duplicates removed
+        """
+        unique: Dict[str, str] = {}
+        for url in urls:
+            try:
+                parts = urlsplit(url)
+                key = urlunsplit((
+                    parts.scheme.lower(),
+                    parts.netloc.lower(),
+                    parts.path.rstrip('/'),
+                    parts.query,
+                    ''
+                ))
+            except ValueError:
+                # Malformed URLs (e.g. invalid IPv6 hosts) are compared verbatim
+                # and left for the crawl itself to report as failed
+                key = url
+            unique.setdefault(key, url)
+        return list(unique.values())
 
     @staticmethod
     def markdown_to_text_regex(markdown_str: str) -> str:
@@ -73,31 +288,35 @@ class WebCrawler:
         Returns:
             str: Converted plain text
         """
+        markdown_str = _truncate_markdown(markdown_str)
+
         # Remove heading symbols
-        text = re.sub(r'#+\s*', '', markdown_str)
+        text = _RE_HEADER.sub('', markdown_str)
 
         # Remove links and images
-        text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
+        text = _RE_LINK.sub(r'\1', text)
+
+        # Remove code blocks
+        text = '\n'.join(_drop_fenced_lines(text.split('\n')))
 
-        # Remove bold, italic, and other emphasis markers
-        text = re.sub(r'(\*\*|__)(.*?)\1', r'\2', text)
-        text = re.sub(r'(\*|_)(.*?)\1', r'\2', text)
+        # Remove bold, italic, and inline code markers in a single pass
+        text = _RE_INLINE.sub(_replace_inline, text)
 
         # Remove list markers
-        text = re.sub(r'^[\*\-\+]\s*', '', text, flags=re.MULTILINE)
-
-        # Remove code blocks
-        text = re.sub(r'`{3}.*?`{3}', '', text, flags=re.DOTALL)
-        text = re.sub(r'`(.*?)`', r'\1', text)
+        text = _RE_LIST.sub('', text)
 
         # Remove quote blocks
-        text = re.sub(r'^>\s*', '', text, flags=re.MULTILINE)
+        text = _RE_QUOTE.sub('', text)
 
         return text.strip()
 
     @staticmethod
-    def markdown_to_text(markdown_str: str) -> str:
-        """Convert Markdown text to plain text using markdown and BeautifulSoup libraries
+    def markdown_to_text_fast(markdown_str: str) -> str:
+        """Convert Markdown text to plain text with a single line-oriented scan
+
+        Block markers are recognised from the start of each line, so no HTML is
+        rendered. Fenced code blocks and horizontal rules are dropped, and
+        blank lines are removed.
 
         Args:
             markdown_str: Markdown formatted text
@@ -105,21 +324,65 @@ class WebCrawler:
         Returns:
             str: Converted plain text
         """
-        html = markdown.markdown(markdown_str, extensions=['fenced_code'])
-        # Extract plain text using BeautifulSoup
-        soup = BeautifulSoup(html, "html.parser")
+        markdown_str = _truncate_markdown(markdown_str)
+
+        lines: List[str] = []
+        # Split like _truncate_markdown; strip() removes the '\r' of CRLF line ends
+        for line in _drop_fenced_lines(markdown_str.split('\n')):
+            stripped = line.strip()
+            if not stripped or _RE_RULE.fullmatch(stripped):
+                continue
+            text = _RE_LINE_PREFIX.sub('', stripped, count=1).strip()
+            if text:
+                lines.append(text)
+
+        # Inline markup never changes line structure, so handle it in one pass
+        text = _RE_LINK.sub(r'\1', '\n'.join(lines))
+        return _RE_INLINE.sub(_replace_inline, text)
+
+    @staticmethod
+    def markdown_to_text(markdown_str: str) -> str:
+        """Convert Markdown text to plain text using mistune and lxml (or BeautifulSoup) libraries
+
+        Args:
+            markdown_str: Markdown formatted text
+
+        Returns:
+            str: Converted plain text
 
-        text = soup.get_text(separator="\n")  # Preserve paragraph line breaks
+        Raises:
+            ImportError: If the optional "html" extra is not installed
+        """
+        if _MD is None:  # pragma: no cover
+            raise ImportError('markdown_to_text requires the "html" extra: pip install "searcrawl[html]"')
+
+        markdown_str = _truncate_markdown(markdown_str)
+
+        # mistune parses fenced code blocks by default
+        html = cast(str, _MD(markdown_str))
+        if etree is not None:
+            # Extract plain text with lxml; block-level line breaks are kept as text nodes
+            # Parse bytes with an explicit encoding, since lxml rejects str input
+            # carrying an XML encoding declaration; libxml2 also stops at NUL bytes
+            data = html.replace('\x00', '').encode('utf-8')
+            root = etree.HTML(data, etree.HTMLParser(encoding='utf-8')) if data else None
+            text = root.xpath("string()") if root is not None else ""
+        else:
+            # Fall back to BeautifulSoup's pure-Python parser
+            from bs4 import BeautifulSoup
+
+            soup = BeautifulSoup(html, "html.parser")
+            text = soup.get_text(separator="\n")  # Preserve paragraph line breaks
 
         # Clean up extra blank lines
-        cleaned_text = "\n".join([
-            line.strip() for line in text.split("\n") if line.strip()
-        ])
+        cleaned_text = "\n".join(
+            stripped for line in text.split("\n") if (stripped := line.strip())
+        )
 
         return cleaned_text
 
-    @staticmethod
-    def make_searxng_request(
+    async def make_searxng_request(
+        self,
         query: str,
         limit: int = 10,
         disabled_engines: str = DISABLED_ENGINES,
@@ -140,10 +403,6 @@ class WebCrawler:
             Exception: Raised when request fails
         """
         try:
-            conn = http.client.HTTPConnection(SEARXNG_HOST, SEARXNG_PORT)
-            dataList = []
-            boundary = 'wL36Yn8afVp8Ag7AmP8qZ0SA4n1v9T'
-
             form_data = {
                 'q': query,
                 'format': 'json',
@@ -154,36 +413,81 @@ class WebCrawler:
                 'category_general': '1'
             }
 
-            # Add form fields
-            for key, value in form_data.items():
-                dataList.append(encode('--' + boundary))
-                dataList.append(encode(f'Content-Disposition: form-data; name={key};'))
-                dataList.append(encode('Content-Type: {}'.format('text/plain')))
-                dataList.append(encode(''))
-                dataList.append(encode(str(value)))
-
-            dataList.append(encode('--'+boundary+'--'))
-            dataList.append(encode(''))
-            body = b'\r\n'.join(dataList)
+            body = urlencode(form_data).encode('utf-8')
 
             headers = {
                 'Cookie': f'disabled_engines={disabled_engines};enabled_engines={enabled_engines};method=POST',
-                'User-Agent': 'Sear-Crawl4AI/1.0.0',
-                'Accept': '*/*',
-                'Host': f'{SEARXNG_HOST}:{SEARXNG_PORT}',
-                'Connection': 'keep-alive',
-                'Content-Type': f'multipart/form-data; boundary={boundary}'
+                'Content-Type': 'application/x-www-form-urlencoded'
             }
 
-            logger.info(f"Sending search request to SearXNG: {query}")
-            conn.request("POST", SEARXNG_BASE_PATH, body, headers)
-            res = conn.getresponse()
-            data = res.read()
-            return json.loads(data.decode("utf-8"))
+            logger.info("Sending search request to SearXNG: {}", query)
+            res = await self._http.post(SEARXNG_BASE_PATH, content=body, headers=headers)
+            # orjson parses the raw bytes directly, without a separate decode pass
+            return orjson.loads(res.content)
         except Exception as e:
-            logger.error(f"SearXNG request failed: {str(e)}")
+            logger.error("SearXNG request failed: {}", e)
             raise Exception(f"Search request failed: {str(e)}")
 
+    async def _crawl_many(self, urls: List[str], config: CrawlerRunConfig) -> List[Any]:
+        """Crawl URLs with arun_many, limited to CRAWL_CONCURRENCY open pages
+
+        The dispatcher keeps crawl4ai's default rate limiting (backoff and
+        retries on 429/503) and shares one semaphore between all crawls, so
+        concurrent requests run side by side without exceeding the page limit.
+
+        Args:
+            urls: List of URLs to crawl
+            config: Crawler run configuration
+
+        Returns:
+            List[Any]: Crawl results in the same order as urls; None for URLs
+            without a result
+        """
+        dispatcher = _SharedSemaphoreDispatcher(
+            self._crawl_semaphore,
+            rate_limiter=RateLimiter(base_delay=(1.0, 3.0), max_delay=60.0, max_retries=3),
+        )
+        results = await self.crawler.arun_many(urls=urls, config=config, dispatcher=dispatcher)
+
+        # Look results up by URL, so URLs without a result map to None
+        results_by_url = {getattr(result, 'url', None): result for result in results}
+        return [results_by_url.get(url) for url in urls]
+
+    @staticmethod
+    def _extract(
+        result: Any,
+        url: str,
+        retry_list: List[str],
+        failed_list: List[str]
+    ) -> Optional[str]:
+        """Extract markdown content from a crawl result, recording the URL on failure
+
+        Args:
+            result: Crawl result returned by arun_many, possibly None
+            url: URL the result belongs to
+            retry_list: List receiving URLs whose failure is transient
+            failed_list: List receiving URLs that failed permanently
+
+        Returns:
+            Optional[str]: Markdown content, or None if the crawl failed
+        """
+        try:
+            markdown_content = getattr(getattr(result, 'markdown', None), 'fit_markdown', None)
+            success = getattr(result, 'success', False)
+            if success and markdown_content:
+                return str(markdown_content)
+
+            if success or _is_transient_failure(result):
+                logger.debug("URL crawl failed or returned no content: {}", url)
+                retry_list.append(url)
+            else:
+                logger.debug("URL crawl failed permanently: {}", url)
+                failed_list.append(url)
+        except Exception as e:
+            logger.warning("Processing crawl result failed: {}, error: {}", url, e)
+            retry_list.append(url)
+        return None
+
     async def crawl_urls(self, urls: List[str], instruction: str) -> Dict[str, Any]:
         """Crawl multiple URLs and process content
 
@@ -198,6 +502,9 @@ class WebCrawler:
             HTTPException: Raised when all URL crawls fail
         """
         try:
+            # Skip duplicate URLs returned by multiple search engines
+            urls = self.dedupe_urls(urls)
+
             # Check if crawler has been initialized
             if not self.crawler:
                 logger.warning("Crawler not initialized, auto-initializing")
@@ -224,91 +531,52 @@ class WebCrawler:
                 cache_mode=CacheMode.BYPASS
             )
 
-            logger.info(f"Starting to crawl URLs: {', '.join(urls)}")
-            results = await self.crawler.arun_many(urls=urls, config=run_config)
+            logger.opt(lazy=True).info("Starting to crawl URLs: {}", lambda: ', '.join(urls))
+            results = await self._crawl_many(urls, run_config)
 
             # Create a list to store crawl results from all successful URLs
-            all_results = []
-            failed_urls = []
-            retry_urls = []
+            all_results: List[str] = []
+            failed_urls: List[str] = []
+            retry_urls: List[str] = []
 
             # First crawl attempt processing
-            for i, result in enumerate(results):
-                try:
-                    if result is None:
-                        logger.debug(f"URL crawl result is None: {urls[i]}")
-                        retry_urls.append(urls[i])
-                        continue
-
-                    if not hasattr(result, 'success'):
-                        logger.debug(f"URL crawl result missing success attribute: {urls[i]}")
-                        retry_urls.append(urls[i])
-                        continue
-
-                    if result.success:
-                        if not hasattr(result, 'markdown') or not hasattr(result.markdown, 'fit_markdown'):
-                            logger.debug(f"URL crawl result missing markdown content: {urls[i]}")
-                            retry_urls.append(urls[i])
-                            continue
-
-                        # Add successful result's markdown content to the list
-                        result_with_source = result.markdown.fit_markdown + '\n\n'
-                        all_results.append(result_with_source)
-                        logger.info(f"Successfully crawled URL: {urls[i]}")
-                    else:
-                        logger.debug(f"URL crawl failed: {urls[i]}")
-                        retry_urls.append(urls[i])
-                except Exception as e:
-                    # Record URLs that need retry
-                    retry_urls.append(urls[i])
-                    error_msg = str(e)
-                    logger.warning(f"URL first crawl attempt failed: {urls[i]}, error: {error_msg}")
+            for url, result in zip(urls, results):
+                markdown_content = self._extract(result, url, retry_urls, failed_urls)
+                if markdown_content:
+                    all_results.append(markdown_content)
+                    logger.info("Successfully crawled URL: {}", url)
+
+            # Cap the number of retried URLs; the rest are reported as failed
+            if len(retry_urls) > MAX_RETRY_URLS:
+                failed_urls.extend(retry_urls[MAX_RETRY_URLS:])
+                retry_urls = retry_urls[:MAX_RETRY_URLS]
 
             # If there are URLs to retry, perform second crawl attempt
             if retry_urls:
-                logger.info(f"Retrying failed URLs: {', '.join(retry_urls)}")
-                retry_results = await self.crawler.arun_many(urls=retry_urls, config=run_config)
-
-                for i, result in enumerate(retry_results):
-                    try:
-                        if result is None:
-                            logger.debug(f"Retry URL crawl result is None: {retry_urls[i]}")
-                            failed_urls.append(retry_urls[i])
-                            continue
-
-                        if not hasattr(result, 'success'):
-                            logger.debug(f"Retry URL crawl result missing success attribute: {retry_urls[i]}")
-                            failed_urls.append(retry_urls[i])
-                            continue
-
-                        if result.success:
-                            if not hasattr(result, 'markdown') or not hasattr(result.markdown, 'fit_markdown'):
-                                logger.debug(f"Retry URL crawl result missing markdown content: {retry_urls[i]}")
-                                failed_urls.append(retry_urls[i])
-                                continue
-
-                            # Add successful retry result to the list
-                            result_with_source = result.markdown.fit_markdown + '\n\n'
-                            all_results.append(result_with_source)
-                            logger.info(f"Successfully crawled URL on retry: {retry_urls[i]}")
-                        else:
-                            logger.debug(f"Retry URL crawl still failed: {retry_urls[i]}")
-                            failed_urls.append(retry_urls[i])
-                    except Exception as e:
-                        # Record finally failed URLs
-                        failed_urls.append(retry_urls[i])
-                        error_msg = str(e)
-                        logger.error(f"URL second crawl attempt failed: {retry_urls[i]}, error: {error_msg}")
+                logger.opt(lazy=True).info("Retrying failed URLs: {}", lambda: ', '.join(retry_urls))
+                await asyncio.sleep(_RETRY_DELAY)
+                retry_results = await self._crawl_many(retry_urls, run_config)
+
+                for url, result in zip(retry_urls, retry_results):
+                    # Failures on retry are final regardless of their cause
+                    markdown_content = self._extract(result, url, failed_urls, failed_urls)
+                    if markdown_content:
+                        all_results.append(markdown_content)
+                        logger.info("Successfully crawled URL on retry: {}", url)
 
             if not all_results:
                 logger.error("All URL crawls failed")
                 raise HTTPException(status_code=500, detail="All URL crawls failed")
 
-            # Join all successful results into a complete string with separators
-            combined_content = '\n\n==========\n\n'.join(all_results)
-
-            # Convert to plain text
-            plain_text = self.markdown_to_text_regex(self.markdown_to_text(combined_content))
+            # Convert each page on its own, so the size cap of one huge page
+            # cannot push the pages after it out of the response
+            logger.opt(lazy=True).debug(
+                "Converting content to plain text, length: {}",
+                lambda: sum(len(page) for page in all_results),
+            )
+            plain_text = '\n==========\n'.join(
+                self.markdown_to_text_fast(page) for page in all_results
+            )
 
             response = {
                 "content": plain_text,
@@ -316,8 +584,8 @@ class WebCrawler:
                 "failed_urls": failed_urls
             }
 
-            logger.info(f"Crawl completed, successful: {len(all_results)}, failed: {len(failed_urls)}")
+            logger.info("Crawl completed, successful: {}, failed: {}", len(all_results), len(failed_urls))
             return response
         except Exception as e:
-            logger.error(f"Exception occurred during crawling: {str(e)}")
+            logger.error("Exception occurred during crawling: {}", e)
             raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
@@ -9,9 +9,11 @@ This project can serve as an open-source alternative to Tavily, providing simila
 and web content extraction capabilities.
 """
 
-from typing import List
+from typing import AsyncIterator, List, Optional
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
+from playwright.async_api import Error as PlaywrightError
 from pydantic import BaseModel
 import uvicorn
 import sys
@@ -24,30 +26,43 @@ from searcrawl.config import (
     API_PORT,
     DEFAULT_SEARCH_LIMIT,
     DISABLED_ENGINES,
-    ENABLED_ENGINES
+    ENABLED_ENGINES,
+    PLAYWRIGHT_INSTALL_ON_STARTUP
 )
 from searcrawl.crawler import WebCrawler
 import searcrawl.logger as log_module
 
 # Global crawler instance
-crawler = None
+crawler: Optional[WebCrawler] = None
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
+async def get_crawler() -> AsyncIterator[WebCrawler]:
     """
-    Application lifespan context manager
+    Provide the crawler instance for a request
 
-    Handles startup and shutdown events for the FastAPI application
+    Yields the global instance created during application startup. When the
+    lifespan has not run, e.g. under a plain TestClient, a temporary instance
+    is created for the request and closed afterwards; its browser is only
+    started if crawl_urls is reached.
     """
-    global crawler
+    if crawler is not None:
+        yield crawler
+        return
 
-    # Startup
-    log_module.setup_logger("INFO")
-    logger.info("Sear-Crawl4AI service starting...")
+    temporary_crawler = WebCrawler()
+    try:
+        yield temporary_crawler
+    finally:
+        await temporary_crawler.close()
 
-    # Check and install browsers
-    logger.info("Checking Playwright browsers...")
+
+def install_playwright_browsers() -> None:
+    """Install the Chromium browser used by Playwright
+
+    Raises:
+        subprocess.CalledProcessError: Raised when installation fails
+    """
+    logger.info("Installing Playwright browsers...")
     try:
         subprocess.run(
             [sys.executable, "-m", "playwright", "install", "chromium"],
@@ -58,9 +73,44 @@ async def lifespan(app: FastAPI):
         logger.error(f"Browser installation failed: {e}")
         raise
 
+
+def is_missing_browser_error(error: Exception) -> bool:
+    """Check whether an exception means the Playwright browser is not installed"""
+    return isinstance(error, PlaywrightError) and "Executable doesn't exist" in str(error)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan context manager
+
+    Handles startup and shutdown events for the FastAPI application
+    """
+    global crawler
+
+    # Startup
+    log_module.setup_logger("INFO")
+    logger.info("Sear-Crawl4AI service starting...")
+
+    if PLAYWRIGHT_INSTALL_ON_STARTUP:
+        install_playwright_browsers()
+
     # Initialize crawler
     crawler = WebCrawler()
-    await crawler.initialize()
+    try:
+        try:
+            await crawler.initialize()
+        except Exception as e:
+            if PLAYWRIGHT_INSTALL_ON_STARTUP or not is_missing_browser_error(e):
+                raise
+            # Browsers are usually installed at build time; install only when missing
+            logger.warning(f"Playwright browser not found, installing: {e}")
+            install_playwright_browsers()
+            await crawler.initialize()
+    except Exception:
+        await crawler.close()
+        crawler = None
+        raise
     logger.info("Crawler initialization completed")
     logger.info(f"API service running at: http://{API_HOST}:{API_PORT}")
     logger.info("Sear-Crawl4AI service startup completed")
@@ -70,6 +120,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     if crawler:
         await crawler.close()
+        crawler = None
         logger.info("Crawler resources released")
     logger.info("Sear-Crawl4AI service shut down")
 
@@ -80,6 +131,7 @@ app = FastAPI(
     description="An open-source search and crawling tool based on SearXNG and Crawl4AI, "
                 "serving as an open-source alternative to Tavily",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -112,12 +164,13 @@ class CrawlRequest(BaseModel):
     instruction: str
 
 
-async def crawl(request: CrawlRequest):
+async def crawl(request: CrawlRequest, web_crawler: WebCrawler):
     """
     API endpoint function to crawl multiple URLs and process content
 
     Args:
         request: Crawl request containing URLs and instruction
+        web_crawler: Crawler instance used for the request
 
     Returns:
         Dict: Dictionary containing processed content, success count, and failed URLs
@@ -125,12 +178,11 @@ async def crawl(request: CrawlRequest):
     Raises:
         HTTPException: Raised when an error occurs during crawling
     """
-    global crawler
-    return await crawler.crawl_urls(request.urls, request.instruction)
+    return await web_crawler.crawl_urls(request.urls, request.instruction)
 
 
 @app.post("/search")
-async def search(request: SearchRequest):
+async def search(request: SearchRequest, web_crawler: WebCrawler = Depends(get_crawler)):
     """
     Search API endpoint
 
@@ -139,6 +191,7 @@ async def search(request: SearchRequest):
 
     Args:
         request: Search request object containing query string and configuration parameters
+        web_crawler: Crawler instance provided by get_crawler
 
     Returns:
         Dict: Dictionary containing processed content, success count, and failed URLs
@@ -151,7 +204,7 @@ async def search(request: SearchRequest):
         logger.info(f"Starting search: {request.query}")
 
         # Call SearXNG search engine
-        response = WebCrawler.make_searxng_request(
+        response = await web_crawler.make_searxng_request(
             query=request.query,
             limit=request.limit,
             disabled_engines=request.disabled_engines,
@@ -173,7 +226,7 @@ async def search(request: SearchRequest):
         logger.info(f"Found {len(urls)} URLs, starting to crawl")
 
         # Call crawl function to process URLs
-        return await crawl(CrawlRequest(urls=urls, instruction=request.query))
+        return await crawl(CrawlRequest(urls=urls, instruction=request.query), web_crawler)
     except HTTPException:
         # Directly re-raise HTTP exceptions
         raise
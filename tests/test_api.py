@@ -5,6 +5,10 @@ Tests for API endpoints
 
 import pytest
 from fastapi.testclient import TestClient
+from playwright.async_api import Error as PlaywrightError
+
+import searcrawl.main as main
+from searcrawl.crawler import WebCrawler
 from searcrawl.main import app
 
 
@@ -39,4 +43,67 @@ def test_api_docs_accessible(client):
     assert response.status_code == 200
     
     response = client.get("/openapi.json")
-    assert response.status_code == 200
\ No newline at end of file
+    assert response.status_code == 200
+
+def _patch_startup(monkeypatch, install_on_startup, launch_errors):
+    """Patch browser installation and crawler initialization for lifespan tests"""
+    events = []
+    errors = list(launch_errors)
+
+    async def initialize(self):
+        events.append("initialize")
+        if errors:
+            raise errors.pop(0)
+
+    monkeypatch.setattr(main, "PLAYWRIGHT_INSTALL_ON_STARTUP", install_on_startup)
+    monkeypatch.setattr(main, "install_playwright_browsers", lambda: events.append("install"))
+    monkeypatch.setattr(WebCrawler, "initialize", initialize)
+    return events
+
+
+@pytest.mark.asyncio
+async def test_lifespan_installs_browsers_when_flag_set(monkeypatch):
+    """Test that browsers are always installed when PLAYWRIGHT_INSTALL_ON_STARTUP is set"""
+    events = _patch_startup(monkeypatch, True, [])
+
+    async with main.lifespan(app):
+        assert isinstance(main.crawler, WebCrawler)
+
+    assert events == ["install", "initialize"]
+    assert main.crawler is None
+
+
+@pytest.mark.asyncio
+async def test_lifespan_skips_install_when_browser_launches(monkeypatch):
+    """Test that no installation runs when the browser launches on the first attempt"""
+    events = _patch_startup(monkeypatch, False, [])
+
+    async with main.lifespan(app):
+        pass
+
+    assert events == ["initialize"]
+
+
+@pytest.mark.asyncio
+async def test_lifespan_installs_browsers_when_missing(monkeypatch):
+    """Test that a missing browser is installed and initialization retried"""
+    missing = PlaywrightError("BrowserType.launch: Executable doesn't exist at /ms-playwright")
+    events = _patch_startup(monkeypatch, False, [missing])
+
+    async with main.lifespan(app):
+        pass
+
+    assert events == ["initialize", "install", "initialize"]
+
+
+@pytest.mark.asyncio
+async def test_lifespan_does_not_install_on_other_failures(monkeypatch):
+    """Test that unrelated initialization errors are raised without installing browsers"""
+    events = _patch_startup(monkeypatch, False, [RuntimeError("out of memory")])
+
+    with pytest.raises(RuntimeError):
+        async with main.lifespan(app):
+            pass
+
+    assert events == ["initialize"]
+    assert main.crawler is None
@@ -3,6 +3,8 @@
 Tests for config module
 """
 
+from collections.abc import Mapping
+
 import pytest
 from searcrawl.config import get_config_info
 
@@ -11,7 +13,7 @@ def test_get_config_info():
     """Test that get_config_info returns expected structure"""
     config = get_config_info()
     
-    assert isinstance(config, dict)
+    assert isinstance(config, Mapping)
     assert "searxng" in config
     assert "api" in config
     assert "crawler" in config
@@ -22,6 +24,7 @@ def test_get_config_info():
     assert "port" in config["searxng"]
     assert "base_path" in config["searxng"]
     assert "api_base" in config["searxng"]
+    assert "timeout" in config["searxng"]
     
     # Check API config structure
     assert "host" in config["api"]
@@ -31,6 +34,11 @@ def test_get_config_info():
     assert "default_search_limit" in config["crawler"]
     assert "content_filter_threshold" in config["crawler"]
     assert "word_count_threshold" in config["crawler"]
+    assert "max_retry_urls" in config["crawler"]
+    assert "crawl_concurrency" in config["crawler"]
+    assert "max_doc_size" in config["crawler"]
+    assert "max_line_length" in config["crawler"]
+    assert "playwright_install_on_startup" in config["crawler"]
     
     # Check search engines config structure
     assert "disabled" in config["search_engines"]
@@ -45,4 +53,15 @@ def test_config_types():
     assert isinstance(config["searxng"]["port"], int)
     assert isinstance(config["api"]["port"], int)
     assert isinstance(config["crawler"]["default_search_limit"], int)
-    assert isinstance(config["crawler"]["content_filter_threshold"], float)
\ No newline at end of file
+    assert isinstance(config["crawler"]["content_filter_threshold"], float)
+
+
+def test_config_info_is_cached_and_read_only():
+    """Test that get_config_info returns the same immutable mapping"""
+    config = get_config_info()
+
+    assert get_config_info() is config
+    with pytest.raises(TypeError):
+        config["api"] = {}
+    with pytest.raises(TypeError):
+        config["api"]["port"] = 0
@@ -3,8 +3,19 @@
 Tests for crawler module
 """
 
+import asyncio
+from types import SimpleNamespace
+from urllib.parse import parse_qs
+
+import httpx
 import pytest
-from searcrawl.crawler import WebCrawler
+from searcrawl.config import (
+    MAX_DOC_SIZE,
+    MAX_LINE_LENGTH,
+    SEARXNG_BASE_PATH,
+    SEARXNG_BASE_URL,
+)
+from searcrawl.crawler import WebCrawler, _is_transient_failure, _truncate_markdown
 
 
 def test_markdown_to_text_regex():
@@ -31,8 +42,32 @@ def test_markdown_to_text_regex():
     assert "https://" not in result
 
 
+def test_markdown_to_text_regex_code_and_emphasis():
+    """Test removal of code blocks, inline code and nested emphasis"""
+    markdown_text = "Use `pip` to install **bold *nested* text**.\n```\ncode block\n```\nDone"
+
+    result = WebCrawler.markdown_to_text_regex(markdown_text)
+
+    assert "pip" in result
+    assert "bold nested text" in result
+    assert "code block" not in result
+    assert "`" not in result
+    assert "*" not in result
+    assert "Done" in result
+
+
+def test_markdown_to_text_images_and_unterminated_fence():
+    """Test that images keep their alt text and unterminated fences lose the opener"""
+    markdown_text = "See ![Diagram](https://example.com/a.png) here\n```python\nprint(1)"
+
+    for convert in (WebCrawler.markdown_to_text_regex, WebCrawler.markdown_to_text_fast):
+        result = convert(markdown_text)
+
+        assert result.split("\n") == ["See Diagram here", "print(1)"]
+
+
 def test_markdown_to_text():
-    """Test markdown to text conversion using markdown library"""
+    """Test markdown to text conversion using mistune library"""
     markdown_text = """
     # Heading
     
@@ -46,6 +81,174 @@ def test_markdown_to_text():
     assert len(result) > 0
 
 
+def test_markdown_to_text_unusual_input():
+    """Test that encoding declarations and NUL bytes do not break text extraction"""
+    assert WebCrawler.markdown_to_text('<?xml version="1.0" encoding="utf-8"?>\nhello') == "hello"
+    assert WebCrawler.markdown_to_text("\x00abc") == "abc"
+    assert WebCrawler.markdown_to_text("") == ""
+
+
+def test_markdown_to_text_fast():
+    """Test markdown to text conversion using the line-oriented scan"""
+    markdown_text = """
+    # Heading
+
+    This is **bold**, *italic* and `code` with a [Link](https://example.com).
+
+    > Quoted line
+    - List item 1
+    1. Numbered item
+
+    ---
+
+    ```python
+    print("hidden")
+    ```
+
+    ==========
+    """
+
+    result = WebCrawler.markdown_to_text_fast(markdown_text)
+
+    assert result.split("\n") == [
+        "Heading",
+        "This is bold, italic and code with a Link.",
+        "Quoted line",
+        "List item 1",
+        "Numbered item",
+        "==========",
+    ]
+
+
+def test_markdown_to_text_fast_keeps_plain_punctuation():
+    """Test that words, arithmetic and escaped characters survive conversion"""
+    markdown_text = (
+        "snake_case_names and __init__ stay\n"
+        "5 * 3 = 15 and 2 * 4\n"
+        "1\\. Not a list\n"
+        "foo\\_bar\\_baz and \\*literal\\*\n"
+        "Title\n"
+        "====="
+    )
+
+    result = WebCrawler.markdown_to_text_fast(markdown_text)
+
+    assert result.split("\n") == [
+        "snake_case_names and init stay",
+        "5 * 3 = 15 and 2 * 4",
+        "1. Not a list",
+        "foo_bar_baz and *literal*",
+        "Title",
+        "=====",
+    ]
+
+
+def test_markdown_to_text_truncates_oversized_input():
+    """Test that oversized documents and lines are truncated before conversion"""
+    long_line = "`" + "x" * (MAX_LINE_LENGTH * 2)
+    assert WebCrawler.markdown_to_text_fast(long_line) == long_line[:MAX_LINE_LENGTH]
+
+    huge_doc = "word\n" * (MAX_DOC_SIZE // 5 + 1000)
+    for convert in (WebCrawler.markdown_to_text_fast, WebCrawler.markdown_to_text_regex):
+        assert len(convert(huge_doc)) <= MAX_DOC_SIZE
+
+
+def test_truncate_markdown_keeps_lines_at_the_limit():
+    """Test that only lines beyond MAX_LINE_LENGTH are cut and CRLF input converts cleanly"""
+    line = "x" * MAX_LINE_LENGTH
+    assert _truncate_markdown(line + "\nshort") == line + "\nshort"
+    assert _truncate_markdown("y" + line + "\nshort") == "y" + line[1:] + "\nshort"
+    assert WebCrawler.markdown_to_text_fast("# Title\r\n- item\r\n") == "Title\nitem"
+
+
+@pytest.mark.asyncio
+async def test_crawl_urls_caps_each_page_separately(monkeypatch):
+    """Test that an oversized page does not push later pages out of the content"""
+    crawler = WebCrawler()
+    crawler.crawler = SimpleNamespace()
+    pages = {
+        "https://example.com/huge": "word\n" * (MAX_DOC_SIZE // 5 + 1000),
+        "https://example.com/small": "last page",
+    }
+
+    async def crawl_many(urls, config):
+        return [
+            SimpleNamespace(url=url, success=True, markdown=SimpleNamespace(fit_markdown=pages[url]))
+            for url in urls
+        ]
+
+    monkeypatch.setattr(crawler, "_crawl_many", crawl_many)
+
+    response = await crawler.crawl_urls(list(pages), "query")
+
+    assert response["success_count"] == 2
+    assert response["content"].endswith("\n==========\nlast page")
+    crawler.crawler = None
+    await crawler.close()
+
+
+def test_markdown_to_text_unclosed_markers_do_not_backtrack():
+    """Test that unclosed markup near the size cap converts instead of hanging"""
+    # Every line opens a link, emphasis, code span and '_' that are never closed
+    line = "see [note here ** ` _"
+    count = MAX_DOC_SIZE // (len(line) + 1)
+    markdown_text = "\n".join([line] * count)
+
+    for convert in (WebCrawler.markdown_to_text_fast, WebCrawler.markdown_to_text_regex):
+        result = convert(markdown_text)
+        assert result.count("see [note here") == count
+
+
+def test_dedupe_urls():
+    """Test that duplicate URLs are removed while preserving order"""
+    urls = [
+        "https://example.com/page",
+        "https://other.com/",
+        "HTTPS://Example.com/page/",
+        "https://example.com/page#section",
+        "https://other.com",
+        "https://example.com/page?q=1",
+        "http://[abc/x",
+        "http://[abc/x",
+    ]
+
+    result = WebCrawler.dedupe_urls(urls)
+
+    assert result == [
+        "https://example.com/page",
+        "https://other.com/",
+        "https://example.com/page?q=1",
+        "http://[abc/x",
+    ]
+
+
+def test_is_transient_failure():
+    """Test that only transient crawl failures are retried"""
+    assert _is_transient_failure(SimpleNamespace(status_code=503, error_message=None))
+    assert _is_transient_failure(SimpleNamespace(status_code=429, error_message=None))
+    assert _is_transient_failure(SimpleNamespace(status_code=None, error_message="Timeout 30000ms"))
+    assert not _is_transient_failure(SimpleNamespace(status_code=404, error_message=None))
+    assert not _is_transient_failure(
+        SimpleNamespace(status_code=None, error_message="net::ERR_NAME_NOT_RESOLVED")
+    )
+
+
+def test_extract_records_failed_urls():
+    """Test that crawl results are sorted into content, retries and failures"""
+    retry_urls, failed_urls = [], []
+    ok = SimpleNamespace(success=True, markdown=SimpleNamespace(fit_markdown="content"))
+    empty = SimpleNamespace(success=True, markdown=SimpleNamespace(fit_markdown=""))
+    missing = SimpleNamespace(success=False, status_code=404, error_message=None)
+
+    assert WebCrawler._extract(ok, "https://a.com", retry_urls, failed_urls) == "content"
+    assert WebCrawler._extract(empty, "https://b.com", retry_urls, failed_urls) is None
+    assert WebCrawler._extract(None, "https://c.com", retry_urls, failed_urls) is None
+    assert WebCrawler._extract(missing, "https://d.com", retry_urls, failed_urls) is None
+
+    assert retry_urls == ["https://b.com", "https://c.com"]
+    assert failed_urls == ["https://d.com"]
+
+
 @pytest.mark.asyncio
 async def test_webcrawler_initialization():
     """Test WebCrawler initialization"""
@@ -56,6 +259,121 @@ async def test_webcrawler_initialization():
     # This is a basic structure test only
 
 
+@pytest.mark.asyncio
+async def test_crawl_many_shares_page_limit_and_orders_results(monkeypatch):
+    """Test that concurrent crawls overlap within one page limit and results follow the URLs"""
+    monkeypatch.setattr("searcrawl.crawler.CRAWL_CONCURRENCY", 3)
+    crawler = WebCrawler()
+    active = set()
+    peak = 0
+    overlapped = False
+
+    async def arun(url, config, session_id):
+        nonlocal peak, overlapped
+        active.add(url)
+        peak = max(peak, len(active))
+        overlapped = overlapped or bool(active & set(first_urls) and active & set(second_urls))
+        await asyncio.sleep(0.01)
+        active.discard(url)
+        return SimpleNamespace(url=url, success=True, status_code=200)
+
+    async def arun_many(urls, config, dispatcher):
+        task_results = await dispatcher.run_urls(crawler=fake, urls=urls, config=config)
+        # Return results out of order, one URL without a result
+        return [task_result.result for task_result in reversed(task_results[1:])]
+
+    fake = SimpleNamespace(arun=arun, arun_many=arun_many)
+    crawler.crawler = fake
+    # One host per URL, so the rate limiter does not delay the test
+    first_urls = [f"https://a{i}.example.com/" for i in range(2)]
+    second_urls = [f"https://b{i}.example.com/" for i in range(2)]
+
+    first, second = await asyncio.gather(
+        crawler._crawl_many(first_urls, None), crawler._crawl_many(second_urls, None)
+    )
+
+    assert overlapped
+    assert peak == 3
+    assert first[0] is None and second[0] is None
+    assert [result.url for result in first[1:]] == first_urls[1:]
+    assert [result.url for result in second[1:]] == second_urls[1:]
+
+
+@pytest.mark.asyncio
+async def test_make_searxng_request():
+    """Test that SearXNG is queried with a urlencoded POST and the JSON is parsed"""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"results": [{"url": "https://example.com"}]})
+
+    crawler = WebCrawler(
+        http_client=httpx.AsyncClient(
+            base_url=SEARXNG_BASE_URL, transport=httpx.MockTransport(handler)
+        )
+    )
+
+    result = await crawler.make_searxng_request(
+        "open source & search", enabled_engines="google__general"
+    )
+    await crawler.close()
+
+    assert result == {"results": [{"url": "https://example.com"}]}
+    assert len(requests) == 1
+    request = requests[0]
+    assert request.method == "POST"
+    assert request.url.path == SEARXNG_BASE_PATH
+    assert request.headers["Content-Type"] == "application/x-www-form-urlencoded"
+    assert "enabled_engines=google__general" in request.headers["Cookie"]
+    form = parse_qs(request.content.decode("utf-8"))
+    assert form["q"] == ["open source & search"]
+    assert form["format"] == ["json"]
+
+
+@pytest.mark.asyncio
+async def test_make_searxng_request_failure():
+    """Test that SearXNG transport errors are reported as exceptions"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    crawler = WebCrawler(
+        http_client=httpx.AsyncClient(
+            base_url=SEARXNG_BASE_URL, transport=httpx.MockTransport(handler)
+        )
+    )
+
+    with pytest.raises(Exception, match="Search request failed"):
+        await crawler.make_searxng_request("test")
+    await crawler.close()
+
+
+@pytest.mark.asyncio
+async def test_initialize_closes_half_started_crawler(monkeypatch):
+    """Test that a failed browser launch stops the Playwright driver it started"""
+    closed = []
+
+    class FailingCrawler:
+        def __init__(self, config):
+            pass
+
+        async def __aenter__(self):
+            raise RuntimeError("launch failed")
+
+        async def close(self):
+            closed.append(True)
+
+    monkeypatch.setattr("searcrawl.crawler.AsyncWebCrawler", FailingCrawler)
+    crawler = WebCrawler()
+
+    with pytest.raises(RuntimeError):
+        await crawler.initialize()
+    await crawler.close()
+
+    assert closed == [True]
+    assert crawler.crawler is None
+
+
 def test_webcrawler_creation():
     """Test WebCrawler object creation"""
     crawler = WebCrawler()